@@ -12,48 +12,58 @@ Notes:
 - Ignores "<not supported>" lines.
 - Tries to capture a single "Unit" (e.g., "msec" for task-clock, "seconds" for time elapsed).
 - Keeps units as-is (no normalization), since perf mixes units per metric.
-- Adds Delta and % Improvement columns (positive % means Optimized is faster/smaller).
+- Adds a Delta column (Optimized - Baseline; negative means Optimized is faster/smaller).
+- Rows follow the order metrics appear in the baseline file.
 """
 
 from __future__ import annotations
 import argparse
+import contextlib
 import csv
+import mmap
+import os
 import re
+import stat
 from pathlib import Path
 from typing import Dict, Tuple, Optional
 
-# Regex for normal counter lines (value [unit] metric ... # comment)
-# Examples:
+# Single regex for every line we care about, applied with re.MULTILINE over the
+# memory-mapped file so the per-line Python loop (splitlines/strip/match) disappears.
+# It is a bytes pattern: the file is scanned in place and only matched groups
+# are decoded.
+# Horizontal whitespace is spelled [ \t] so a match never spans two lines.
+#
+# "time elapsed" summary with mean +- std (tried first):
+#   0.205303 +- 0.000699 seconds time elapsed  ( +-  0.34% )
+# Normal counter lines (value [unit] metric ... # comment):
 #   200.74 msec task-clock                #    0.978 CPUs utilized           ( +-  0.16% )
 #   521,061,541      cycles               #    2.586 GHz                     ( +-  0.17% )
-LINE_RE = re.compile(
-    r""" ^
-        \s*
-        (?P<value>[0-9][0-9,\.]*)           # numeric value (commas allowed)
-        \s+
-        (?:(?P<unit>[A-Za-z/%\-]+)\s+)?     # optional unit token (e.g., msec)
-        (?P<metric>[A-Za-z0-9_\-./]+)       # metric name (e.g., task-clock, cycles)
-        (?: \s+ \# \s* (?P<comment>.*) )?   # optional comment after '#'
-        \s* $
-    """,
-    re.VERBOSE,
-)
-
-# Regex for "time elapsed" summary with mean +- std:
-#   0.205303 +- 0.000699 seconds time elapsed  ( +-  0.34% )
-TIME_ELAPSED_RE = re.compile(
-    r""" ^
-        \s*
-        (?P<mean>[0-9]+(?:\.[0-9]+)?)      # mean value
-        \s* \+\- \s*
-        (?P<std>[0-9]+(?:\.[0-9]+)?)       # stddev
-        \s*
-        (?P<unit>[A-Za-z/%\-]+)            # unit (e.g., seconds)
-        \s+ time \s+ elapsed
-        (?: \s* \( .* \) )?                # optional "( +- x% )"
-        \s* $
+PERF_LINE_RE = re.compile(
+    rb""" ^
+        [ \t]*
+        (?! [^\n]* <not\ supported> )           # skip unsupported counters
+        (?:
+            (?P<time>
+                (?P<mean>[0-9]+(?:\.[0-9]+)?)      # mean value
+                [ \t]* \+\- [ \t]*
+                (?P<std>[0-9]+(?:\.[0-9]+)?)       # stddev
+                [ \t]*
+                (?P<time_unit>[A-Za-z/%\-]+)       # unit (e.g., seconds)
+                [ \t]+ time [ \t]+ elapsed
+                (?: [ \t]* \( .* \) )?             # optional "( +- x% )"
+            )
+          |
+            (?P<counter>
+                (?P<value>[0-9][0-9,\.]*)           # numeric value (commas allowed)
+                [ \t]+
+                (?:(?P<unit>[A-Za-z/%\-]+)[ \t]+)?  # optional unit token (e.g., msec)
+                (?P<metric>[A-Za-z0-9_\-./]+)       # metric name (e.g., task-clock, cycles)
+                (?: [ \t]+ \# [ \t]* (?P<comment>.*) )?   # optional comment after '#'
+            )
+        )
+        [ \t\r]* $
     """,
-    re.VERBOSE,
+    re.VERBOSE | re.MULTILINE,
 )
 
 def _parse_number(s: str) -> Optional[float]:
@@ -62,6 +72,10 @@ def _parse_number(s: str) -> Optional[float]:
     except Exception:
         return None
 
+def _group(m: re.Match, name: str) -> str:
+    g = m.group(name)
+    return g.decode("ascii", errors="ignore") if g is not None else ""
+
 def parse_perf_file(path: Path) -> Dict[str, Tuple[float, str, Optional[float]]]:
     """
     Returns:
@@ -72,39 +86,38 @@ def parse_perf_file(path: Path) -> Dict[str, Tuple[float, str, Optional[float]]]
     """
     metrics: Dict[str, Tuple[float, str, Optional[float]]] = {}
 
-    text = path.read_text(errors="ignore")
-    for raw in text.splitlines():
-        line = raw.strip()
-
-        # Skip unsupported lines
-        if "<not supported>" in line:
-            continue
-
-        # Try time elapsed special case
-        mtime = TIME_ELAPSED_RE.match(line)
-        if mtime:
-            mean = _parse_number(mtime.group("mean"))
-            std  = _parse_number(mtime.group("std"))
-            unit = (mtime.group("unit") or "").strip()
-            if mean is not None:
-                metrics["time-elapsed"] = (mean, unit, std)
-            continue
-
-        # Try generic counter line
-        m = LINE_RE.match(line)
-        if not m:
-            continue
-
-        val = _parse_number(m.group("value"))
-        if val is None:
-            continue
-
-        unit = (m.group("unit") or "").strip()
-        metric = (m.group("metric") or "").strip()
-
-        # Heuristic: if metric looks like a unit, and unit is empty, try to fix.
-        # (Usually not needed, but kept for odd outputs.)
-        metrics[metric] = (val, unit, None)
+    # Scan the file through mmap instead of read_text(): no decoded copy of the
+    # whole file is held in memory, the OS pages it in as the regex advances.
+    # Only non-empty regular files can be mapped; pipes/FIFOs (e.g. <(cat f))
+    # also report st_size 0, so those and empty files are read() instead.
+    with path.open("rb") as f:
+        st = os.fstat(f.fileno())
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            source = contextlib.nullcontext(f.read())
+        with source as text:
+            for m in PERF_LINE_RE.finditer(text):
+                # Time elapsed special case
+                if m.group("time") is not None:
+                    mean = _parse_number(_group(m, "mean"))
+                    std  = _parse_number(_group(m, "std"))
+                    unit = _group(m, "time_unit").strip()
+                    if mean is not None:
+                        metrics["time-elapsed"] = (mean, unit, std)
+                    continue
+
+                # Generic counter line
+                val = _parse_number(_group(m, "value"))
+                if val is None:
+                    continue
+
+                unit = _group(m, "unit").strip()
+                metric = _group(m, "metric").strip()
+
+                # Heuristic: if metric looks like a unit, and unit is empty, try to fix.
+                # (Usually not needed, but kept for odd outputs.)
+                metrics[metric] = (val, unit, None)
 
     return metrics
 
@@ -117,33 +130,24 @@ def compare(
       dict: metric -> (
         base_val, base_unit, base_std,
         opt_val,  opt_unit,  opt_std,
-        delta, improvement_pct
+        delta
       )
+
+    Metrics keep the order they were found in the baseline file, followed by
+    the ones only present in the optimized file.
     """
-    all_keys = sorted(set(base.keys()) | set(opt.keys()))
     out = {}
-    for k in all_keys:
-        b = base.get(k)
+    for k, (b_val, b_unit, b_std) in base.items():
         o = opt.get(k)
+        if o is None:
+            out[k] = (b_val, b_unit, b_std, None, "", None, None)
+            continue
+        o_val, o_unit, o_std = o
+        out[k] = (b_val, b_unit, b_std, o_val, o_unit, o_std, o_val - b_val)
 
-        b_val = b[0] if b else None
-        b_unit = b[1] if b else ""
-        b_std = b[2] if b else None
-
-        o_val = o[0] if o else None
-        o_unit = o[1] if o else ""
-        o_std = o[2] if o else None
-
-        delta = None
-        improvement = None
-        if (b_val is not None) and (o_val is not None):
-            delta = o_val - b_val
-            if b_val != 0:
-                # For "better is lower" metrics (time, task-clock, cycles, misses),
-                # improvement% = (baseline - optimized) / baseline * 100
-                improvement = (b_val - o_val) / b_val * 100.0
-
-        out[k] = (b_val, b_unit, b_std, o_val, o_unit, o_std, delta, improvement)
+    for k, (o_val, o_unit, o_std) in opt.items():
+        if k not in base:
+            out[k] = (None, "", None, o_val, o_unit, o_std, None)
     return out
 
 def main():
@@ -167,7 +171,7 @@ def main():
             "Optimized Value",
             "Delta (Opt - Base)"
         ])
-        for metric, (b_val, b_unit, b_std, o_val, o_unit, o_std, delta, improvement) in comp.items():
+        for metric, (b_val, b_unit, b_std, o_val, o_unit, o_std, delta) in comp.items():
             def fmt(x, dig=6):
                 if x is None:
                     return ""
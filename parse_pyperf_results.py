@@ -17,10 +17,11 @@ import re
 from pathlib import Path
 from typing import Dict, Tuple
 
+# Applied with re.MULTILINE over the whole file; [ \t] keeps each match on one line.
 LINE_RE = re.compile(
-    r'^(?P<name>[A-Za-z0-9_\-\.]+):\s*Mean\s*\+\-\s*std dev:\s*'
-    r'(?P<mean>[\d\.]+)\s*(?P<unit>[munskµ]*s)\s*\+\-\s*(?P<std>[\d\.]+)\s*(?P<std_unit>[munskµ]*s)\s*$',
-    re.IGNORECASE
+    r'^[ \t]*(?P<name>[A-Za-z0-9_\-\.]+):[ \t]*Mean[ \t]*\+\-[ \t]*std dev:[ \t]*'
+    r'(?P<mean>[\d\.]+)[ \t]*(?P<unit>[munskµ]*s)[ \t]*\+\-[ \t]*(?P<std>[\d\.]+)[ \t]*(?P<std_unit>[munskµ]*s)[ \t\r]*$',
+    re.IGNORECASE | re.MULTILINE
 )
 
 _TO_US = {
@@ -49,20 +50,12 @@ def from_us(value_us: float, target_unit: str) -> float:
     return value_us
 
 def parse_file(path: Path) -> Dict[str, Tuple[float, float]]:
-    results: Dict[str, Tuple[float, float]] = {}
-    for line in path.read_text(errors="ignore").splitlines():
-        m = LINE_RE.match(line.strip())
-        if not m:
-            continue
-        name = m.group("name")
-        mean = float(m.group("mean"))
-        std  = float(m.group("std"))
-        unit = m.group("unit")
-        std_unit = m.group("std_unit")
-        mean_us = to_us(mean, unit)
-        std_us  = to_us(std, std_unit)
-        results[name] = (mean_us, std_us)
-    return results
+    # One findall over the whole text instead of a Python-level loop per line;
+    # later entries for the same benchmark win, as before.
+    return {
+        name: (to_us(float(mean), unit), to_us(float(std), std_unit))
+        for name, mean, unit, std, std_unit in LINE_RE.findall(path.read_text(errors="ignore"))
+    }
 
 def main():
     ap = argparse.ArgumentParser(description="Compare pyperformance results (baseline vs optimized).")
@@ -92,10 +85,11 @@ def main():
             b_mean_us, b_std_us = base.get(name, (float("nan"), float("nan")))
             o_mean_us, o_std_us = opt.get(name,  (float("nan"), float("nan")))
 
-            b_mean = from_us(b_mean_us, args.unit) if b_mean_us == b_mean_us else float("nan")
-            b_std  = from_us(b_std_us,  args.unit) if b_std_us  == b_std_us  else float("nan")
-            o_mean = from_us(o_mean_us, args.unit) if o_mean_us == o_mean_us else float("nan")
-            o_std  = from_us(o_std_us,  args.unit) if o_std_us  == o_std_us  else float("nan")
+            # NaN propagates through the unit conversion, no need to guard it
+            b_mean = from_us(b_mean_us, args.unit)
+            b_std  = from_us(b_std_us,  args.unit)
+            o_mean = from_us(o_mean_us, args.unit)
+            o_std  = from_us(o_std_us,  args.unit)
 
             if b_mean == b_mean and o_mean == o_mean and b_mean != 0.0:
                 delta = o_mean - b_mean
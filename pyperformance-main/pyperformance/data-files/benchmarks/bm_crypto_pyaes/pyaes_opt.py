@@ -206,69 +206,61 @@ class AES(object):
         if len(plaintext) != 16:
             raise ValueError('wrong block length')
 
-        rounds = len(self._Ke) - 1
-        a = [0, 0, 0, 0]
+        # Hoist the tables and round keys into locals once per block, and keep
+        # the state in four local ints: the round loop then does only
+        # LOAD_FAST/BINARY_SUBSCR instead of self.Tn attribute lookups and
+        # list-slot stores on every word.
+        T1 = self.T1
+        T2 = self.T2
+        T3 = self.T3
+        T4 = self.T4
+        S = self.S
+        Ke = self._Ke
+        rounds = len(Ke) - 1
 
         # Convert plaintext to (ints ^ key)
-        t = [(_compact_word(plaintext[4 * i:4 * i + 4]) ^ self._Ke[0][i]) for i in xrange(0, 4)]
+        k0, k1, k2, k3 = Ke[0]
+        t0 = _compact_word(plaintext[0:4]) ^ k0
+        t1 = _compact_word(plaintext[4:8]) ^ k1
+        t2 = _compact_word(plaintext[8:12]) ^ k2
+        t3 = _compact_word(plaintext[12:16]) ^ k3
 
         # Apply round transforms
+        # (t >> 24 needs no mask: every state word is an XOR of non-negative
+        # 32-bit table entries and round keys, so it stays below 2**32 and
+        # t >> 24 is already in range(256))
         for r in xrange(1, rounds):
-            # i = 0
-            a[0] = (self.T1[(t[0] >> 24)] ^
-                    self.T2[(t[1] >> 16) & 0xFF] ^
-                    self.T3[(t[2] >> 8)  & 0xFF] ^
-                    self.T4[t[3] & 0xFF] ^
-                    self._Ke[r][0])
-            # i = 1
-            a[1] = (self.T1[(t[1] >> 24)] ^
-                    self.T2[(t[2] >> 16) & 0xFF] ^
-                    self.T3[(t[3] >> 8)  & 0xFF] ^
-                    self.T4[t[0] & 0xFF] ^
-                    self._Ke[r][1])
-            # i = 2
-            a[2] = (self.T1[(t[2] >> 24)] ^
-                    self.T2[(t[3] >> 16) & 0xFF] ^
-                    self.T3[(t[0] >> 8)  & 0xFF] ^
-                    self.T4[t[1] & 0xFF] ^
-                    self._Ke[r][2])
-            # i = 3
-            a[3] = (self.T1[(t[3] >> 24)] ^
-                    self.T2[(t[0] >> 16) & 0xFF] ^
-                    self.T3[(t[1] >> 8)  & 0xFF] ^
-                    self.T4[t[2] & 0xFF] ^
-                    self._Ke[r][3])
-            
-            t,a = a,t
+            k0, k1, k2, k3 = Ke[r]
+            t0, t1, t2, t3 = (
+                T1[t0 >> 24] ^ T2[(t1 >> 16) & 0xFF] ^ T3[(t2 >> 8) & 0xFF] ^ T4[t3 & 0xFF] ^ k0,
+                T1[t1 >> 24] ^ T2[(t2 >> 16) & 0xFF] ^ T3[(t3 >> 8) & 0xFF] ^ T4[t0 & 0xFF] ^ k1,
+                T1[t2 >> 24] ^ T2[(t3 >> 16) & 0xFF] ^ T3[(t0 >> 8) & 0xFF] ^ T4[t1 & 0xFF] ^ k2,
+                T1[t3 >> 24] ^ T2[(t0 >> 16) & 0xFF] ^ T3[(t1 >> 8) & 0xFF] ^ T4[t2 & 0xFF] ^ k3,
+            )
 
         # The last round is special
-        result = [ ]
-        # i = 0
-        tt = self._Ke[rounds][0]
-        result.append((self.S[(t[0] >> 24)] ^ (tt >> 24)) & 0xFF)
-        result.append((self.S[(t[1] >> 16) & 0xFF] ^ (tt >> 16)) & 0xFF)
-        result.append((self.S[(t[2] >>  8) & 0xFF] ^ (tt >>  8)) & 0xFF)
-        result.append((self.S[ t[3]        & 0xFF] ^  tt       ) & 0xFF)
-        # i = 1
-        tt = self._Ke[rounds][1]
-        result.append((self.S[(t[1] >> 24)] ^ (tt >> 24)) & 0xFF)
-        result.append((self.S[(t[2] >> 16) & 0xFF] ^ (tt >> 16)) & 0xFF)
-        result.append((self.S[(t[3] >>  8) & 0xFF] ^ (tt >>  8)) & 0xFF)
-        result.append((self.S[ t[0]        & 0xFF] ^  tt       ) & 0xFF)
-        # i = 2
-        tt = self._Ke[rounds][2]
-        result.append((self.S[(t[2] >> 24)] ^ (tt >> 24)) & 0xFF)
-        result.append((self.S[(t[3] >> 16) & 0xFF] ^ (tt >> 16)) & 0xFF)
-        result.append((self.S[(t[0] >>  8) & 0xFF] ^ (tt >>  8)) & 0xFF)
-        result.append((self.S[ t[1]        & 0xFF] ^  tt       ) & 0xFF)
-        # i = 3
-        tt = self._Ke[rounds][3]
-        result.append((self.S[(t[3] >> 24)] ^ (tt >> 24)) & 0xFF)
-        result.append((self.S[(t[0] >> 16) & 0xFF] ^ (tt >> 16)) & 0xFF)
-        result.append((self.S[(t[1] >>  8) & 0xFF] ^ (tt >>  8)) & 0xFF)
-        result.append((self.S[ t[2]        & 0xFF] ^  tt       ) & 0xFF)
-
-        return result
+        k0, k1, k2, k3 = Ke[rounds]
+        return [
+            (S[t0 >> 24] ^ (k0 >> 24)) & 0xFF,
+            (S[(t1 >> 16) & 0xFF] ^ (k0 >> 16)) & 0xFF,
+            (S[(t2 >>  8) & 0xFF] ^ (k0 >>  8)) & 0xFF,
+            (S[ t3        & 0xFF] ^  k0       ) & 0xFF,
+
+            (S[t1 >> 24] ^ (k1 >> 24)) & 0xFF,
+            (S[(t2 >> 16) & 0xFF] ^ (k1 >> 16)) & 0xFF,
+            (S[(t3 >>  8) & 0xFF] ^ (k1 >>  8)) & 0xFF,
+            (S[ t0        & 0xFF] ^  k1       ) & 0xFF,
+
+            (S[t2 >> 24] ^ (k2 >> 24)) & 0xFF,
+            (S[(t3 >> 16) & 0xFF] ^ (k2 >> 16)) & 0xFF,
+            (S[(t0 >>  8) & 0xFF] ^ (k2 >>  8)) & 0xFF,
+            (S[ t1        & 0xFF] ^  k2       ) & 0xFF,
+
+            (S[t3 >> 24] ^ (k3 >> 24)) & 0xFF,
+            (S[(t0 >> 16) & 0xFF] ^ (k3 >> 16)) & 0xFF,
+            (S[(t1 >>  8) & 0xFF] ^ (k3 >>  8)) & 0xFF,
+            (S[ t2        & 0xFF] ^  k3       ) & 0xFF,
+        ]
 
     def decrypt(self, ciphertext):
         'Decrypt a block of cipher text using the AES block cipher.'
@@ -596,19 +588,25 @@ class AESModeOfOperationCTR(AESStreamModeOfOperation):
             counter = Counter()
 
         self._counter = counter
-        self._remaining_counter = [ ]
+        self._remaining_counter = bytearray()
 
     def encrypt(self, plaintext):
-        while len(self._remaining_counter) < len(plaintext):
-            self._remaining_counter += self._aes.encrypt(self._counter.value)
+        # Build the keystream for the whole message first (CTR blocks are
+        # independent), then XOR it in a single big-int operation instead of
+        # one Python-level XOR per byte.
+        keystream = self._remaining_counter
+        while len(keystream) < len(plaintext):
+            keystream.extend(self._aes.encrypt(self._counter.value))
             self._counter.increment()
 
         plaintext = _string_to_bytes(plaintext)
 
-        encrypted = [ (p ^ c) for (p, c) in zip(plaintext, self._remaining_counter) ]
-        self._remaining_counter = self._remaining_counter[len(encrypted):]
+        size = len(plaintext)
+        encrypted = (int.from_bytes(plaintext, 'big') ^
+                     int.from_bytes(keystream[:size], 'big')).to_bytes(size, 'big')
+        del keystream[:size]
 
-        return _bytes_to_string(encrypted)
+        return encrypted
 
     def decrypt(self, crypttext):
         # AES-CTR is symetric
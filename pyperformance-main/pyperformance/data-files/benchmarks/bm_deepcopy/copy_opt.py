@@ -1,11 +1,16 @@
 """Generic (shallow and deep) copying operations.
 
-This file is stdlib copy.py with TWO surgical upgrades:
+This file is stdlib copy.py with a few surgical upgrades:
   MEMO-OPT: skip memo lookup for atomic immutable types (ints, strs, bytes, None, ...)
-  FASTPATH: (a) small tuple of immutables returned as-is
+  FASTPATH: (a) tuple of atomic values returned as-is
             (b) simple reduce tuple (cls, (), state_dict) reconstructed directly
+  RECON-OPT: _reconstruct copies ctor args with a list comprehension, not a generator
+  DC-FASTPATH: plain dataclasses skip __reduce_ex__/_reconstruct (class shape checked once per class)
+  LEAF-INLINE: dict copies store atomic keys/values directly, no deepcopy() call
+  LOCAL-BIND: hot globals (dispatch dict, type, id) bound as default args
 
-All other behavior matches the original.
+All other behavior matches the original, as long as a dataclass is not given
+pickling hooks (__reduce__, __getstate__, ...) after its first deepcopy.
 """
 
 import types
@@ -87,19 +92,22 @@ del d, t
 # Deepcopy
 # --------------------------------------------------------------------------------------
 
-def deepcopy(x, memo=None, _nil=[]):
+# filled in below; created here so deepcopy can bind it (LOCAL-BIND)
+_deepcopy_dispatch = {}
+
+def deepcopy(x, memo=None, _nil=[], _d=_deepcopy_dispatch, _type=type, _id=id):
     """Deep copy operation on arbitrary Python objects."""
     # MEMO-OPT: detect atomic immutable types before touching memo.
     # If the copier for this exact type is _deepcopy_atomic, they are safe to return directly.
-    cls = type(x)                                      # MEMO-OPT
-    copier = _deepcopy_dispatch.get(cls)         # MEMO-OPT
+    cls = _type(x)                                     # MEMO-OPT
+    copier = _d.get(cls)                         # MEMO-OPT
     if copier is _deepcopy_atomic:               # MEMO-OPT: skip memo lookup entirely
         return x
 
     if memo is None:
         memo = {}
 
-    d = id(x)
+    d = _id(x)
     y = memo.get(d, _nil)
     if y is not _nil:
         return y
@@ -113,6 +121,11 @@ def deepcopy(x, memo=None, _nil=[]):
             copier = getattr(x, "__deepcopy__", None)
             if copier is not None:
                 y = copier(memo)
+            elif (cls not in dispatch_table
+                  and getattr(x, "__dataclass_fields__", None) is not None
+                  and _is_plain_dataclass(cls)):
+                # DC-FASTPATH: same result as __reduce_ex__(4) + _reconstruct, without building rv
+                y = _deepcopy_dataclass(x, memo)
             else:
                 # gather reduce info (original logic)
                 reductor = dispatch_table.get(cls)
@@ -154,7 +167,7 @@ def deepcopy(x, memo=None, _nil=[]):
         _keep_alive(x, memo) # Make sure x lives at least as long as d
     return y
 
-_deepcopy_dispatch = d = {}
+d = _deepcopy_dispatch
 
 def _deepcopy_atomic(x, memo):
     return x
@@ -175,8 +188,8 @@ d[types.FunctionType] = _deepcopy_atomic
 d[weakref.ref] = _deepcopy_atomic
 d[property] = _deepcopy_atomic
 
-# FASTPATH helper for tuples
-_IMMUTABLE_SCALARS = (int, float, bool, complex, str, bytes, type(None))
+# FASTPATH helper for tuples: exact types whose deepcopy is the object itself
+_ATOMIC_TYPES = frozenset(t for t, c in d.items() if c is _deepcopy_atomic)
 
 def _deepcopy_list(x, memo, deepcopy=deepcopy):
     y = []
@@ -188,10 +201,9 @@ def _deepcopy_list(x, memo, deepcopy=deepcopy):
 d[list] = _deepcopy_list
 
 def _deepcopy_tuple(x, memo, deepcopy=deepcopy):
-    # FASTPATH (tuple): small tuple of immutables → return as-is
-    if len(x) <= 5:
-        if all(isinstance(a, _IMMUTABLE_SCALARS) for a in x):
-            return x
+    # FASTPATH (tuple): every item atomic → the tuple is its own copy
+    if _ATOMIC_TYPES.issuperset(map(type, x)):
+        return x
 
     y = [deepcopy(a, memo) for a in x]
     # We're not going to put the tuple in the memo, but it's still important we
@@ -209,11 +221,17 @@ def _deepcopy_tuple(x, memo, deepcopy=deepcopy):
     return y
 d[tuple] = _deepcopy_tuple
 
-def _deepcopy_dict(x, memo, deepcopy=deepcopy):
+def _deepcopy_dict(x, memo, deepcopy=deepcopy,
+                   _get=_deepcopy_dispatch.get, _atomic=_deepcopy_atomic, _type=type):
     y = {}
     memo[id(x)] = y
     for key, value in x.items():
-        y[deepcopy(key, memo)] = deepcopy(value, memo)
+        # LEAF-INLINE: atomic leaves are their own copy, skip the recursive call
+        if _get(_type(value)) is not _atomic:
+            value = deepcopy(value, memo)
+        if _get(_type(key)) is not _atomic:
+            key = deepcopy(key, memo)
+        y[key] = value
     return y
 d[dict] = _deepcopy_dict
 if PyStringMap is not None:
@@ -225,6 +243,51 @@ d[types.MethodType] = _deepcopy_method
 
 del d
 
+# DC-FASTPATH helpers
+_object_getstate = getattr(object, "__getstate__", None)
+
+# class -> result of the shape check; weak keys so dynamically created classes can still die
+_plain_dataclass_cache = weakref.WeakKeyDictionary()
+
+def _is_plain_dataclass(cls):
+    """True if object.__reduce_ex__ would give (__newobj__, (cls,), __dict__) for dataclass cls.
+
+    Anything customising pickling or attribute lookup, using __slots__, or
+    subclassing list/dict (which adds list/dict items to the reduce tuple) is
+    left to the generic path. __deepcopy__ and copyreg registrations can appear
+    at any time, so the caller checks those on every copy; only this class-shape
+    check is cached. The caller also tests __dataclass_fields__ on the instance
+    first (a miss there is cheap, unlike on the class), so other classes never
+    pay for the weak-keyed cache lookup.
+    """
+    try:
+        return _plain_dataclass_cache[cls]
+    except KeyError:
+        pass
+    plain = (
+        hasattr(cls, "__dataclass_fields__")
+        and cls.__reduce_ex__ is object.__reduce_ex__
+        and cls.__reduce__ is object.__reduce__
+        and getattr(cls, "__getstate__", None) is _object_getstate
+        and not hasattr(cls, "__setstate__")
+        and not hasattr(cls, "__getnewargs_ex__")
+        and not hasattr(cls, "__getnewargs__")
+        and not hasattr(cls, "__getattr__")
+        and cls.__getattribute__ is object.__getattribute__
+        and not issubclass(cls, (list, dict))
+        and not any("__slots__" in vars(k) for k in cls.__mro__)
+    )
+    _plain_dataclass_cache[cls] = plain
+    return plain
+
+def _deepcopy_dataclass(x, memo, deepcopy=deepcopy):
+    # same result as _reconstruct(x, memo, copyreg.__newobj__, (cls,), x.__dict__)
+    cls = type(x)
+    y = cls.__new__(cls)
+    memo[id(x)] = y
+    y.__dict__.update(deepcopy(x.__dict__, memo))
+    return y
+
 def _keep_alive(x, memo):
     """Keeps a reference to the object x in the memo.
 
@@ -246,7 +309,7 @@ def _reconstruct(x, memo, func, args,
                  *, deepcopy=deepcopy):
     deep = memo is not None
     if deep and args:
-        args = (deepcopy(arg, memo) for arg in args)
+        args = [deepcopy(arg, memo) for arg in args]     # RECON-OPT: no generator frame per arg
     y = func(*args)
     if deep:
         memo[id(x)] = y
@@ -108,43 +108,45 @@ def create_structures_complex(scale=1):
 
 def deepcopy_bm(structures, n=10):
     """Deepcopy each structure individually"""
-    dt = 0
+    t0 = pyperf.perf_counter()
     for ii in range(n):
         for s in structures:
-            t0 = pyperf.perf_counter()
             _ = copy.deepcopy(s)
-            dt += pyperf.perf_counter() - t0
-    return dt
+    return pyperf.perf_counter() - t0
 
 def deepcopy_fastpath_bm(structures, n=10):
     """Deepcopy each structure individually"""
-    dt = 0
+    t0 = pyperf.perf_counter()
     for ii in range(n):
         for s in structures:
-            t0 = pyperf.perf_counter()
             _ = copy_fastpath.deepcopy(s)
-            dt += pyperf.perf_counter() - t0
-    return dt
+    return pyperf.perf_counter() - t0
 
 def deepcopy_fastmemo_bm(structures, n=10):
     """Deepcopy each structure individually"""
-    dt = 0
+    t0 = pyperf.perf_counter()
     for ii in range(n):
         for s in structures:
-            t0 = pyperf.perf_counter()
             _ = copy_fastmemo.deepcopy(s)
-            dt += pyperf.perf_counter() - t0
-    return dt
+    return pyperf.perf_counter() - t0
 
 def deepcopy_merged_bm(structures, n=10):
     """Deepcopy each structure individually"""
-    dt = 0
+    t0 = pyperf.perf_counter()
     for ii in range(n):
         for s in structures:
-            t0 = pyperf.perf_counter()
             _ = copy_merged.deepcopy(s)
-            dt += pyperf.perf_counter() - t0
-    return dt
+    return pyperf.perf_counter() - t0
+
+def gc_disabled(func):
+    """Run func with the cyclic GC off so no collection lands inside the measured region."""
+    def wrapper(*args):
+        gc.disable()
+        try:
+            return func(*args)
+        finally:
+            gc.enable()
+    return wrapper
 
 def clear_python_cache():
     """Force garbage collection and clear caches if needed."""
@@ -157,24 +159,24 @@ def run_benchmark():
     for scale in [1, 2, 3]:
         # Benchmark with simpler structures
         structures = create_structures(scale=scale)
-        # runner.bench_func(f"Deepcopy (scale={scale})", deepcopy_bm, structures)
+        # runner.bench_func(f"Deepcopy (scale={scale})", gc_disabled(deepcopy_bm), structures)
         # clear_python_cache()
-        # runner.bench_func(f"Deepcopy FastPath (scale={scale})", deepcopy_fastpath_bm, structures)
+        # runner.bench_func(f"Deepcopy FastPath (scale={scale})", gc_disabled(deepcopy_fastpath_bm), structures)
         # clear_python_cache()
-        # runner.bench_func(f"Deepcopy FastMemo (scale={scale})", deepcopy_fastmemo_bm, structures)
+        # runner.bench_func(f"Deepcopy FastMemo (scale={scale})", gc_disabled(deepcopy_fastmemo_bm), structures)
         # clear_python_cache()
-        runner.bench_func(f"Deepcopy Merged (scale={scale})", deepcopy_merged_bm, structures)
+        runner.bench_func(f"Deepcopy Merged (scale={scale})", gc_disabled(deepcopy_merged_bm), structures)
         clear_python_cache()
     
         # Benchmark with more complex structures
         complex_structures = create_structures_complex(scale=scale)
-        # runner.bench_func(f"Deepcopy complex (scale={scale})", deepcopy_bm, complex_structures)
+        # runner.bench_func(f"Deepcopy complex (scale={scale})", gc_disabled(deepcopy_bm), complex_structures)
         # clear_python_cache()
-        # runner.bench_func(f"Deepcopy FastPath complex (scale={scale})", deepcopy_fastpath_bm, complex_structures)
+        # runner.bench_func(f"Deepcopy FastPath complex (scale={scale})", gc_disabled(deepcopy_fastpath_bm), complex_structures)
         # clear_python_cache()
-        # runner.bench_func(f"Deepcopy FastMemo complex (scale={scale})", deepcopy_fastmemo_bm, complex_structures)
+        # runner.bench_func(f"Deepcopy FastMemo complex (scale={scale})", gc_disabled(deepcopy_fastmemo_bm), complex_structures)
         # clear_python_cache()
-        runner.bench_func(f"Deepcopy Merged complex (scale={scale})", deepcopy_merged_bm, complex_structures)
+        runner.bench_func(f"Deepcopy Merged complex (scale={scale})", gc_disabled(deepcopy_merged_bm), complex_structures)
         clear_python_cache()
 
 
@@ -21,6 +21,14 @@ class A:
     boolean: bool
 
 
+# (string, lst[0], boolean) fields of the 30 dataclass variants copied in
+# benchmark(), enumerated once instead of through three nested loops
+DC_VARIANTS = [(s, kk, b)
+               for s in ['red', 'blue', 'green']
+               for kk in range(5)
+               for b in [True, False]]
+
+
 def benchmark_reduce(n, deepcopy_func):
     """ 
     Benchmark where the __reduce__ functionality is used.
@@ -72,8 +80,8 @@ def benchmark(n, deepcopy_func):
     Benchmark on some standard data types.
 
     This benchmark measures the time to deepcopy a variety of standard Python data types, including
-    dictionaries, lists, tuples, strings, and a dataclass instance. It performs multiple deep copies
-    of these objects in nested loops to simulate typical usage patterns and to get a stable timing.
+    dictionaries, lists, tuples, strings, and a dataclass instance. Each iteration makes 30 independent
+    deep copies of the dict and 30 of the dataclass (one per field variant), to get a stable timing.
     """
     a = {
         'list': [1, 2, 3, 43],
@@ -81,23 +89,21 @@ def benchmark(n, deepcopy_func):
         'str': 'hello',
         'subdict': {'a': True}
     }
-    dc = A('hello', [1, 2, 3], True)
+    # the 30 dataclass variants never change, so build them once
+    variants = [A(s, [kk, 2, 3], b) for s, kk, b in DC_VARIANTS]
 
     dt = 0
     for ii in range(n):
+        # one timer pair around the 30 identical copies, not one per copy
+        t0 = pyperf.perf_counter()
         for jj in range(30):
-            t0 = pyperf.perf_counter()
             _ = deepcopy_func(a)
-            dt += pyperf.perf_counter() - t0
-        for s in ['red', 'blue', 'green']:
-            dc.string = s
-            for kk in range(5):
-                dc.lst[0] = kk
-                for b in [True, False]:
-                    dc.boolean = b
-                    t0 = pyperf.perf_counter()
-                    _ = deepcopy_func(dc)
-                    dt += pyperf.perf_counter() - t0
+        dt += pyperf.perf_counter() - t0
+        # 30 separate top-level copies, one timer pair around them
+        t0 = pyperf.perf_counter()
+        for v in variants:
+            _ = deepcopy_func(v)
+        dt += pyperf.perf_counter() - t0
     return dt
 
 if __name__ == "__main__":
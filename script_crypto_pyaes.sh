@@ -23,14 +23,19 @@ python3 -m pip install py-spy
 # AES library used by the crypto_pyaes benchmark
 python3 -m pip install pyaes
 
+# OpenSSL-backed AES (AES-NI) used by the crypto_pyaes_openssl benchmark
+python3 -m pip install cryptography
+
 # Make sure local copy.py / copy_opt.py is on PYTHONPATH if needed
 export PYTHONPATH=$PYTHONPATH:$(pwd)
 
 # AES
+# The optimised runs pass --pure-python so they measure pyaes_opt against the
+# pure-Python baseline; the OpenSSL variant is recorded separately at the end.
 mkdir -p res/aes
 # run AES benchmark with perf stat (baseline + optimised)
 perf stat -r 5 -d -d -d -- python3 pyperformance-main/pyperformance/data-files/benchmarks/bm_crypto_pyaes/run_benchmark.py > res/aes/perf_stat_aes_baseline.txt 2>&1
-perf stat -r 5 -d -d -d -- python3 pyperformance-main/pyperformance/data-files/benchmarks/bm_crypto_pyaes/run_benchmark_opt.py > res/aes/perf_stat_aes_opt.txt 2>&1
+perf stat -r 5 -d -d -d -- python3 pyperformance-main/pyperformance/data-files/benchmarks/bm_crypto_pyaes/run_benchmark_opt.py --pure-python > res/aes/perf_stat_aes_opt.txt 2>&1
 
 python3 parse_perf_stat_compare.py \
   res/aes/perf_stat_aes_baseline.txt \
@@ -40,22 +45,26 @@ python3 parse_perf_stat_compare.py \
 # run single AES benchmark with flame graph using pyspy (baseline + optimised)
 py-spy record --rate 25000 --subprocesses --output res/aes/flamegraph_aes_baseline.svg --format flamegraph --nonblocking  -- python3 pyperformance-main/pyperformance/data-files/benchmarks/bm_crypto_pyaes/single_aes.py
 
-py-spy record --rate 25000 --subprocesses --output res/aes/flamegraph_aes_opt.svg --format flamegraph --nonblocking  -- python3 pyperformance-main/pyperformance/data-files/benchmarks/bm_crypto_pyaes/single_aes_opt.py
+py-spy record --rate 25000 --subprocesses --output res/aes/flamegraph_aes_opt.svg --format flamegraph --nonblocking  -- python3 pyperformance-main/pyperformance/data-files/benchmarks/bm_crypto_pyaes/single_aes_opt.py --pure-python
 
 # run AES benchmark with perf report (baseline + optimised)
 perf record --call-graph dwarf -F 999 -g -- python3-dbg pyperformance-main/pyperformance/data-files/benchmarks/bm_crypto_pyaes/single_aes.py
 perf report --stdio --call-graph graph,0,caller  --sort=symbol  --no-children --percentage relative > res/aes/perf_report_aes_baseline.txt
 
-perf record --call-graph dwarf -F 999 -g -- python3-dbg pyperformance-main/pyperformance/data-files/benchmarks/bm_crypto_pyaes/single_aes_opt.py
+perf record --call-graph dwarf -F 999 -g -- python3-dbg pyperformance-main/pyperformance/data-files/benchmarks/bm_crypto_pyaes/single_aes_opt.py --pure-python
 perf report --stdio --call-graph graph,0,caller  --sort=symbol  --no-children --percentage relative > res/aes/perf_report_aes_opt.txt
 
 # run 2 versions of the full AES benchmark for performance comparison
 python3 pyperformance-main/pyperformance/data-files/benchmarks/bm_crypto_pyaes/run_benchmark.py > res/aes/pyperformance_aes_baseline.txt
 
-python3 pyperformance-main/pyperformance/data-files/benchmarks/bm_crypto_pyaes/run_benchmark_opt.py > res/aes/pyperformance_aes_opt.txt
+python3 pyperformance-main/pyperformance/data-files/benchmarks/bm_crypto_pyaes/run_benchmark_opt.py --pure-python > res/aes/pyperformance_aes_opt.txt
 
 # Parse & compare into CSV
 python3 parse_pyperf_results.py \
   res/aes/pyperformance_aes_baseline.txt \
   res/aes/pyperformance_aes_opt.txt \
   -o res/aes/pyperformance_aes_compare.csv
+
+# OpenSSL (cryptography) variant, reported as crypto_pyaes_openssl so it is
+# not lined up against the pure-Python baseline above
+python3 pyperformance-main/pyperformance/data-files/benchmarks/bm_crypto_pyaes/run_benchmark_opt.py > res/aes/pyperformance_aes_openssl.txt